@@ -86,7 +86,7 @@ if __name__ == "__main__":
             "attrs",
             "glfw",
             "pyopengl",
-            "xxhash",
+            "xxhash>=1.4",
             "pillow",
             "pyparsing",
             "regex"
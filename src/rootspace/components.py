@@ -1,6 +1,8 @@
 # -*- coding: utf-8 -*-
 
+import array
 import enum
+import functools
 import math
 
 import xxhash
@@ -11,15 +13,46 @@ import attr
 import OpenGL.GL as gl
 import PIL.Image
 from attr.validators import instance_of
-from OpenGL.constant import Constant
 
 from .math import Quaternion, Matrix
-from .wrappers import Texture, OpenGlProgram, OpenGlShader
+from .wrappers import Texture, OpenGlProgram, OpenGlShader, OpenGlState
 from .utilities import camelcase_to_underscore
 from .exceptions import FixmeWarning
 from .data_abstractions import Mesh
 
 
+def _index_by_value(enum_type, mapping):
+    """
+    Turn a dictionary keyed by enum members into a tuple indexed by the member values.
+    Values that have no member, or whose member is missing from the mapping, yield None.
+
+    :param enum_type:
+    :param mapping:
+    :return:
+    """
+    table = [None] * (max(m.value for m in enum_type) + 1)
+    for member, value in mapping.items():
+        table[member.value] = value
+
+    return tuple(table)
+
+
+@functools.lru_cache(maxsize=8)
+def _perspective(field_of_view, width, height, near_plane, far_plane):
+    """
+    Calculate the elements of a perspective projection matrix. The result is memoized,
+    because the field of view and the window shape rarely change.
+
+    :param field_of_view:
+    :param width:
+    :param height:
+    :param near_plane:
+    :param far_plane:
+    :return:
+    """
+    return tuple(Matrix.perspective(field_of_view, width / height, near_plane, far_plane))
+
+
 class ComponentMeta(type):
     """
     ComponentMeta registers all Components in ComponentMeta.classes
@@ -36,10 +69,10 @@ class ComponentMeta(type):
 
 
 class Component(object, metaclass=ComponentMeta):
-    pass
+    __slots__ = ()
 
 
-@attr.s
+@attr.s(slots=True, cmp=False, hash=False)
 class BoundingVolume(Component):
     minimum = attr.ib(validator=instance_of(Matrix))
     maximum = attr.ib(validator=instance_of(Matrix))
@@ -60,7 +93,7 @@ class BoundingVolume(Component):
         )
 
 
-@attr.s
+@attr.s(slots=True, cmp=False, hash=False)
 class PhysicsProperties(Component):
     mass = attr.ib(validator=instance_of(float))
     inertia = attr.ib(validator=instance_of(float))
@@ -86,7 +119,7 @@ class PhysicsProperties(Component):
         )
 
 
-@attr.s
+@attr.s(slots=True, cmp=False, hash=False)
 class PhysicsState(Component):
     momentum = attr.ib(validator=instance_of(Matrix))
     force = attr.ib(validator=instance_of(Matrix))
@@ -106,17 +139,29 @@ class PhysicsState(Component):
             Matrix((3, 1), force)
         )
 
+    _zero = array.array("f", bytes(12))
+
     def reset(self):
-        self.momentum = Matrix((3, 1), 0)
-        self.force = Matrix((3, 1), 0)
+        self.momentum.data[:] = self._zero
+        self.force.data[:] = self._zero
 
 
-@attr.s
+@attr.s(slots=True, cmp=False, hash=False)
 class Transform(Component):
-    t = attr.ib(validator=instance_of(Matrix))
-    r = attr.ib(validator=instance_of(Matrix))
-    s = attr.ib(validator=instance_of(Matrix))
+    """
+    Hold the translation, rotation and scaling of an entity as separate 4x4 matrices.
+    The composed matrix and the basis vectors are cached. Assigning to t, r or s drops those caches,
+    but in-place writes to the matrices do not, so replace the matrices rather than mutating them.
+    Use the position setter or reset() to change them in place.
+    """
+    _t = attr.ib(validator=instance_of(Matrix))
+    _r = attr.ib(validator=instance_of(Matrix))
+    _s = attr.ib(validator=instance_of(Matrix))
     camera = attr.ib(validator=instance_of(bool))
+    _basis = attr.ib(default=None, init=False, repr=False)
+    _matrix = attr.ib(default=None, init=False, repr=False)
+
+    _identity = array.array("f", Matrix.identity(4))
 
     @classmethod
     def create(cls, context, position=(0, 0, 0), orientation=(0, 0, 0, 1), scale=(1, 1, 1), camera=False):
@@ -138,44 +183,192 @@ class Transform(Component):
 
         return cls(t, q.matrix, s, camera)
 
+    @property
+    def t(self):
+        return self._t
+
+    @t.setter
+    def t(self, value):
+        self._t = value
+        self._matrix = None
+
+    @property
+    def r(self):
+        return self._r
+
+    @r.setter
+    def r(self, value):
+        self._r = value
+        self._basis = None
+        self._matrix = None
+
+    @property
+    def s(self):
+        return self._s
+
+    @s.setter
+    def s(self, value):
+        self._s = value
+        self._matrix = None
+
+    @property
+    def matrix(self):
+        """
+        Return the composed affine transformation, T @ R @ S, or S @ R @ T for a camera.
+        The product is written out element-wise, because T only holds a translation, R a rotation
+        and S a scaling. This avoids two generic 4x4 matrix multiplications. The result is kept
+        until one of the factors is assigned or the position is set.
+
+        :return:
+        """
+        camera = self.camera
+
+        cached = self._matrix
+        if cached is not None and cached[0] is camera:
+            return cached[1]
+
+        if camera:
+            matrix = self._compose_view(self._t, self._r, self._s)
+        else:
+            matrix = self._compose_model(self._t, self._r, self._s)
+
+        self._matrix = (camera, matrix)
+        return matrix
+
+    @property
+    def model_matrix(self):
+        """
+        Return T @ R @ S regardless of the camera flag. This places the object in world space,
+        which is what collision tests need for camera and non-camera transforms alike.
+
+        :return:
+        """
+        if not self.camera:
+            return self.matrix
+
+        return self._compose_model(self._t, self._r, self._s)
+
+    @staticmethod
+    def _compose_view(t, r, s):
+        """
+        Write out S @ R @ T element-wise.
+
+        :param t:
+        :param r:
+        :param s:
+        :return:
+        """
+        tx, ty, tz = t[0, 3], t[1, 3], t[2, 3]
+        sx, sy, sz = s[0, 0], s[1, 1], s[2, 2]
+        r00, r01, r02 = r[0, 0], r[0, 1], r[0, 2]
+        r10, r11, r12 = r[1, 0], r[1, 1], r[1, 2]
+        r20, r21, r22 = r[2, 0], r[2, 1], r[2, 2]
+
+        return Matrix((4, 4), (
+            sx * r00, sx * r01, sx * r02, sx * (r00 * tx + r01 * ty + r02 * tz),
+            sy * r10, sy * r11, sy * r12, sy * (r10 * tx + r11 * ty + r12 * tz),
+            sz * r20, sz * r21, sz * r22, sz * (r20 * tx + r21 * ty + r22 * tz),
+            0, 0, 0, 1
+        ))
+
+    @staticmethod
+    def _compose_model(t, r, s):
+        """
+        Write out T @ R @ S element-wise.
+
+        :param t:
+        :param r:
+        :param s:
+        :return:
+        """
+        tx, ty, tz = t[0, 3], t[1, 3], t[2, 3]
+        sx, sy, sz = s[0, 0], s[1, 1], s[2, 2]
+
+        return Matrix((4, 4), (
+            r[0, 0] * sx, r[0, 1] * sy, r[0, 2] * sz, tx,
+            r[1, 0] * sx, r[1, 1] * sy, r[1, 2] * sz, ty,
+            r[2, 0] * sx, r[2, 1] * sy, r[2, 2] * sz, tz,
+            0, 0, 0, 1
+        ))
+
     @property
     def right(self):
-        return self.r[:3, :3].t @ Matrix.ex()
+        return self._basis_vectors()[0]
 
     @property
     def up(self):
-        return self.r[:3, :3].t @ Matrix.ey()
+        return self._basis_vectors()[1]
 
     @property
     def forward(self):
-        return self.r[:3, :3].t @ -Matrix.ez()
+        return self._basis_vectors()[2]
 
     @property
     def position(self):
+        t = self._t
         if self.camera:
-            return -self.t[0:3, 3]
+            return Matrix((3, 1), (-t[0, 3], -t[1, 3], -t[2, 3]))
         else:
-            return self.t[0:3, 3]
+            return Matrix((3, 1), (t[0, 3], t[1, 3], t[2, 3]))
 
     @position.setter
     def position(self, value):
         if self.camera:
-            self.t[0:3, 3] = -value
+            self._t[0:3, 3] = -value
         else:
-            self.t[0:3, 3] = value
+            self._t[0:3, 3] = value
+
+        self._matrix = None
+
+    def _basis_vectors(self):
+        """
+        Return the right, up and forward vectors derived from the rotation matrix.
+        The vectors are kept until the rotation matrix is assigned or reset.
+        The returned vectors are shared and must not be modified in place.
+
+        :return:
+        """
+        basis = self._basis
+        if basis is None:
+            r = self._r
+            basis = (
+                Matrix((3, 1), (r[0, 0], r[0, 1], r[0, 2])),
+                Matrix((3, 1), (r[1, 0], r[1, 1], r[1, 2])),
+                Matrix((3, 1), (-r[2, 0], -r[2, 1], -r[2, 2]))
+            )
+            self._basis = basis
+
+        return basis
 
     def reset(self):
-        self.t = Matrix((4, 4))
-        self.r = Matrix((4, 4))
-        self.s = Matrix((4, 4))
+        """
+        Reset translation, rotation and scaling to identity. The matrices are overwritten in place,
+        so the cached derived values are dropped as well.
 
+        :return:
+        """
+        self._t.data[:] = self._identity
+        self._r.data[:] = self._identity
+        self._s.data[:] = self._identity
+        self._basis = None
+        self._matrix = None
 
-@attr.s
+
+@attr.s(slots=True, cmp=False, hash=False)
 class Projection(Component):
-    p = attr.ib(validator=instance_of(Matrix))
+    """
+    Projection holds the parameters of a perspective projection. The projection matrix is only rebuilt
+    when one of the parameters has changed.
+    """
+    _field_of_view = attr.ib(validator=instance_of((int, float)))
+    _shape = attr.ib(validator=instance_of(tuple))
+    _near_plane = attr.ib(validator=instance_of((int, float)))
+    _far_plane = attr.ib(validator=instance_of((int, float)))
+    _p = attr.ib(default=None, init=False, repr=False)
+    _dirty = attr.ib(default=True, init=False, repr=False)
 
     @classmethod
-    def create(cls, context, field_of_view=math.pi / 4, window_shape=(800, 600), near_plane=0 - 1, far_plane=1000):
+    def create(cls, context, field_of_view=math.pi / 4, window_shape=(800, 600), near_plane=0.1, far_plane=1000):
         """
         Create a projection component.
 
@@ -186,16 +379,56 @@ class Projection(Component):
         :param far_plane:
         :return:
         """
-        return cls(
-            Matrix.perspective(field_of_view, window_shape[0] / window_shape[1], near_plane, far_plane)
-        )
+        return cls(field_of_view, tuple(window_shape), near_plane, far_plane)
+
+    @property
+    def field_of_view(self):
+        return self._field_of_view
+
+    @field_of_view.setter
+    def field_of_view(self, value):
+        self._field_of_view = value
+        self._dirty = True
+
+    @property
+    def shape(self):
+        return self._shape
+
+    @shape.setter
+    def shape(self, value):
+        self._shape = tuple(value)
+        self._dirty = True
+
+    @property
+    def near_plane(self):
+        return self._near_plane
+
+    @near_plane.setter
+    def near_plane(self, value):
+        self._near_plane = value
+        self._dirty = True
+
+    @property
+    def far_plane(self):
+        return self._far_plane
+
+    @far_plane.setter
+    def far_plane(self, value):
+        self._far_plane = value
+        self._dirty = True
 
     @property
     def matrix(self):
-        return self.p
+        if self._dirty:
+            self._p = Matrix((4, 4), _perspective(
+                self._field_of_view, self._shape[0], self._shape[1], self._near_plane, self._far_plane
+            ))
+            self._dirty = False
 
+        return self._p
 
-@attr.s
+
+@attr.s(slots=True, cmp=False, hash=False)
 class Model(Component):
     """
     OpenGlModel encapsulates all that belongs to a graphical representation of an object, stored on the GPU.
@@ -203,43 +436,48 @@ class Model(Component):
     _vao = attr.ib(validator=instance_of(int))
     _vbo = attr.ib(validator=instance_of(int))
     _ibo = attr.ib(validator=instance_of(int))
-    _draw_mode = attr.ib(validator=instance_of(Constant))
+    _draw_mode = attr.ib(validator=instance_of(int))
     _index_len = attr.ib(validator=instance_of(int))
-    _index_type = attr.ib(validator=instance_of(Constant))
+    _index_type = attr.ib(validator=instance_of(int))
     _texture = attr.ib(validator=instance_of((type(None), Texture)))
     _program = attr.ib(validator=instance_of(OpenGlProgram))
     _ctx_exit = attr.ib(validator=instance_of(contextlib.ExitStack), repr=False)
-    _render_exit = attr.ib(default=None, validator=instance_of((type(None), contextlib.ExitStack)), repr=False)
 
+    # The OpenGL enums are stored as plain integers, so that no Constant conversion
+    # takes place on every draw call.
     data_types = {
-        "b": gl.GL_BYTE,
-        "B": gl.GL_UNSIGNED_BYTE,
-        "h": gl.GL_SHORT,
-        "H": gl.GL_UNSIGNED_SHORT,
-        "i": gl.GL_INT,
-        "I": gl.GL_UNSIGNED_INT,
-        "f": gl.GL_FLOAT,
-        "d": gl.GL_DOUBLE
+        "b": int(gl.GL_BYTE),
+        "B": int(gl.GL_UNSIGNED_BYTE),
+        "h": int(gl.GL_SHORT),
+        "H": int(gl.GL_UNSIGNED_SHORT),
+        "i": int(gl.GL_INT),
+        "I": int(gl.GL_UNSIGNED_INT),
+        "f": int(gl.GL_FLOAT),
+        "d": int(gl.GL_DOUBLE)
     }
 
-    draw_modes = {
-        Mesh.DrawMode.Points: gl.GL_POINTS,
-        Mesh.DrawMode.LineStrip: gl.GL_LINE_STRIP,
-        Mesh.DrawMode.LineLoop: gl.GL_LINE_LOOP,
-        Mesh.DrawMode.Lines: gl.GL_LINES,
-        Mesh.DrawMode.LineStripAdjacency: gl.GL_LINE_STRIP_ADJACENCY,
-        Mesh.DrawMode.LinesAdjacency: gl.GL_LINES_ADJACENCY,
-        Mesh.DrawMode.TriangleStrip: gl.GL_TRIANGLE_STRIP,
-        Mesh.DrawMode.TriangleFan: gl.GL_TRIANGLE_FAN,
-        Mesh.DrawMode.Triangles: gl.GL_TRIANGLES,
-        Mesh.DrawMode.TriangleStripAdjacency: gl.GL_TRIANGLE_STRIP_ADJACENCY,
-        Mesh.DrawMode.TrianglesAdjacency: gl.GL_TRIANGLES_ADJACENCY,
-        Mesh.DrawMode.Patches: gl.GL_PATCHES
-    }
+    # Indexed by the value of Mesh.DrawMode, so that the draw mode is found by position.
+    # The mapping below stays the source of truth, values without a draw mode map to None.
+    draw_modes = _index_by_value(Mesh.DrawMode, {
+        Mesh.DrawMode.Points: int(gl.GL_POINTS),
+        Mesh.DrawMode.LineStrip: int(gl.GL_LINE_STRIP),
+        Mesh.DrawMode.LineLoop: int(gl.GL_LINE_LOOP),
+        Mesh.DrawMode.Lines: int(gl.GL_LINES),
+        Mesh.DrawMode.LineStripAdjacency: int(gl.GL_LINE_STRIP_ADJACENCY),
+        Mesh.DrawMode.LinesAdjacency: int(gl.GL_LINES_ADJACENCY),
+        Mesh.DrawMode.TriangleStrip: int(gl.GL_TRIANGLE_STRIP),
+        Mesh.DrawMode.TriangleFan: int(gl.GL_TRIANGLE_FAN),
+        Mesh.DrawMode.Triangles: int(gl.GL_TRIANGLES),
+        Mesh.DrawMode.TriangleStripAdjacency: int(gl.GL_TRIANGLE_STRIP_ADJACENCY),
+        Mesh.DrawMode.TrianglesAdjacency: int(gl.GL_TRIANGLES_ADJACENCY),
+        Mesh.DrawMode.Patches: int(gl.GL_PATCHES)
+    })
 
     @classmethod
     def delete_vertex_arrays(cls, num, obj):
         if bool(gl.glDeleteVertexArrays) and obj >= 0:
+            if OpenGlState.vertex_array == obj:
+                OpenGlState.bind_vertex_array(0)
             gl.glDeleteVertexArrays(num, obj)
 
     @classmethod
@@ -247,6 +485,21 @@ class Model(Component):
         if bool(gl.glDeleteBuffers) and obj >= 0:
             gl.glDeleteBuffers(num, obj)
 
+    @classmethod
+    def buffer_data(cls, target, data):
+        """
+        Upload static data to the buffer bound to the specified target. Where the context supports it,
+        the buffer gets immutable storage, which lets the driver place it optimally.
+
+        :param target:
+        :param data:
+        :return:
+        """
+        if OpenGlState.buffer_storage:
+            gl.glBufferStorage(target, len(data), data, 0)
+        else:
+            gl.glBufferData(target, len(data), data, gl.GL_STATIC_DRAW)
+
     @classmethod
     def create(cls, context, mesh_path, vertex_shader_path=None, fragment_shader_path=None, texture_path=None):
         # Load the mesh into memory.
@@ -274,7 +527,7 @@ class Model(Component):
             # Create and bind the Vertex Array Object
             vao = int(gl.glGenVertexArrays(1))
             ctx.callback(cls.delete_vertex_arrays, 1, vao)
-            gl.glBindVertexArray(vao)
+            OpenGlState.bind_vertex_array(vao)
 
             # Compile the shader program
             vertex_shader = OpenGlShader.create(gl.GL_VERTEX_SHADER, mesh.vertex_shader)
@@ -290,13 +543,13 @@ class Model(Component):
             vbo = int(gl.glGenBuffers(1))
             ctx.callback(cls.delete_buffers, 1, vbo)
             gl.glBindBuffer(gl.GL_ARRAY_BUFFER, vbo)
-            gl.glBufferData(gl.GL_ARRAY_BUFFER, len(mesh.data_bytes), mesh.data_bytes, gl.GL_STATIC_DRAW)
+            cls.buffer_data(gl.GL_ARRAY_BUFFER, mesh.data_bytes)
 
             # Initialise the index buffer
             ibo = int(gl.glGenBuffers(1))
             ctx.callback(cls.delete_buffers, 1, ibo)
             gl.glBindBuffer(gl.GL_ELEMENT_ARRAY_BUFFER, ibo)
-            gl.glBufferData(gl.GL_ELEMENT_ARRAY_BUFFER, len(mesh.index_bytes), mesh.index_bytes, gl.GL_STATIC_DRAW)
+            cls.buffer_data(gl.GL_ELEMENT_ARRAY_BUFFER, mesh.index_bytes)
 
             # Set the attribute pointers
             for a in mesh.attributes:
@@ -305,14 +558,14 @@ class Model(Component):
                     a.location, a.components, cls.data_types[mesh.data_type], False, a.stride_bytes, a.start_ptr
                 )
 
-            gl.glBindBuffer(gl.GL_ELEMENT_ARRAY_BUFFER, 0)
+            # The element buffer binding is part of the vertex array state and must stay in place.
             gl.glBindBuffer(gl.GL_ARRAY_BUFFER, 0)
-            gl.glBindVertexArray(0)
+            OpenGlState.bind_vertex_array(0)
 
             ctx_exit = ctx.pop_all()
 
             return cls(
-                vao, vbo, ibo, cls.draw_modes[mesh.draw_mode], len(mesh.index), cls.data_types[mesh.index_type],
+                vao, vbo, ibo, cls.draw_modes[mesh.draw_mode.value], len(mesh.index), cls.data_types[mesh.index_type],
                 tex, program, ctx_exit
             )
 
@@ -336,42 +589,56 @@ class Model(Component):
 
     def __enter__(self):
         """
-        Enable the model.
+        Enable the model. The vertex array object restores the buffer bindings by itself, and
+        bindings that are already current are skipped. An untextured model binds texture 0,
+        so that it does not sample the texture of the previously drawn model.
 
         :return:
         """
-        with contextlib.ExitStack() as ctx_mgr:
-            ctx_mgr.enter_context(self._program)
-
-            if self._texture is not None:
-                ctx_mgr.enter_context(self._texture)
-
-            gl.glBindVertexArray(self._vao)
-            ctx_mgr.callback(gl.glBindVertexArray, 0)
+        OpenGlState.use_program(self._program.obj)
 
-            gl.glBindBuffer(gl.GL_ARRAY_BUFFER, self._vbo)
-            ctx_mgr.callback(gl.glBindBuffer, gl.GL_ARRAY_BUFFER, 0)
-
-            gl.glBindBuffer(gl.GL_ELEMENT_ARRAY_BUFFER, self._ibo)
-            ctx_mgr.callback(gl.glBindBuffer, gl.GL_ELEMENT_ARRAY_BUFFER, 0)
+        if self._texture is not None:
+            OpenGlState.bind_texture_2d(self._texture.obj)
+        else:
+            OpenGlState.bind_texture_2d(0)
 
-            self._render_exit = ctx_mgr.pop_all()
+        OpenGlState.bind_vertex_array(self._vao)
         return self
 
     def __exit__(self, exc_type, exc_val, exc_tb):
         """
-        Disable the model.
+        Leave the model bound. The next model to be enabled replaces the bindings.
 
         :param exc_type:
         :param exc_val:
         :param exc_tb:
         :return:
         """
-        self._render_exit.close()
         return False
 
 
-@attr.s
+class _MachineStateFlag(object):
+    """
+    Expose a single machine state as a boolean attribute. Reading the attribute tests for
+    the state, setting it to a truthy value enters the state.
+    """
+    __slots__ = ("state",)
+
+    def __init__(self, state):
+        self.state = state
+
+    def __get__(self, instance, owner):
+        if instance is None:
+            return self
+
+        return instance._state is self.state
+
+    def __set__(self, instance, value):
+        if value:
+            instance._state = self.state
+
+
+@attr.s(slots=True, cmp=False, hash=False)
 class MachineState(Component):
     """
     Describe whether a particular entity is in working order or not.
@@ -389,53 +656,14 @@ class MachineState(Component):
     _platform = attr.ib(default="", validator=instance_of(str))
     _state = attr.ib(default=MSE.power_off, validator=instance_of(MSE))
 
-    @property
-    def fatal(self):
-        return self._state == MachineState.MSE.fatal
-
-    @fatal.setter
-    def fatal(self, value):
-        if value:
-            self._state = MachineState.MSE.fatal
-
-    @property
-    def power_off(self):
-        return self._state == MachineState.MSE.power_off
-
-    @power_off.setter
-    def power_off(self, value):
-        if value:
-            self._state = MachineState.MSE.power_off
-
-    @property
-    def power_up(self):
-        return self._state == MachineState.MSE.power_up
-
-    @power_up.setter
-    def power_up(self, value):
-        if value:
-            self._state = MachineState.MSE.power_up
-
-    @property
-    def ready(self):
-        return self._state == MachineState.MSE.ready
-
-    @ready.setter
-    def ready(self, value):
-        if value:
-            self._state = MachineState.MSE.ready
+    fatal = _MachineStateFlag(MSE.fatal)
+    power_off = _MachineStateFlag(MSE.power_off)
+    power_up = _MachineStateFlag(MSE.power_up)
+    ready = _MachineStateFlag(MSE.ready)
+    power_down = _MachineStateFlag(MSE.power_down)
 
-    @property
-    def power_down(self):
-        return self._state == MachineState.MSE.power_down
-
-    @power_down.setter
-    def power_down(self, value):
-        if value:
-            self._state = MachineState.MSE.power_down
 
-
-@attr.s
+@attr.s(slots=True, cmp=False, hash=False)
 class NetworkState(Component):
     """
     Describe the state of the network subsystem.
@@ -444,7 +672,7 @@ class NetworkState(Component):
     connected = attr.ib(default=attr.Factory(list), validator=instance_of(list))
 
 
-@attr.s
+@attr.s(slots=True, cmp=False, hash=False)
 class DisplayBuffer(Component):
     """
     Describe the state of the display buffer of the simulated display.
@@ -452,11 +680,36 @@ class DisplayBuffer(Component):
     _buffer = attr.ib(validator=instance_of(Matrix))
     _cursor_x = attr.ib(default=0, validator=instance_of(int))
     _cursor_y = attr.ib(default=0, validator=instance_of(int))
-    _hasher = attr.ib(default=attr.Factory(xxhash.xxh64), validator=instance_of(xxhash.xxh64))
-    _digest = attr.ib(default=b"", validator=instance_of(bytes))
+    _digest = attr.ib(default=None, validator=instance_of((type(None), int)))
+    _version = attr.ib(default=0, init=False, repr=False)
+    _seen_version = attr.ib(default=-1, init=False, repr=False)
+    _exposed = attr.ib(default=False, init=False, repr=False)
+
+    @classmethod
+    def create(cls, shape):
+        """
+        Create a blank DisplayBuffer of the specified shape. The cells are stored as
+        contiguous unsigned bytes, one byte per cell.
+
+        :param shape:
+        :return:
+        """
+        return cls(Matrix(shape, 0x20, data_type="B"))
 
     @property
     def buffer(self):
+        """
+        Return the underlying buffer. Since the caller may keep the buffer and write to it
+        at any time, all later checks for modifications have to hash it.
+
+        :return:
+        """
+        if not self._exposed:
+            # Take a reference digest, unless there are writes that were not reported yet
+            if self._version == self._seen_version:
+                self._digest = xxhash.xxh3_64_intdigest(self._buffer.data)
+            self._exposed = True
+
         return self._buffer
 
     @property
@@ -475,58 +728,86 @@ class DisplayBuffer(Component):
     def modified(self):
         """
         Determine if the buffer was modified since the last access to this property.
+        As long as the buffer was never handed out via DisplayBuffer.buffer, only writes
+        through DisplayBuffer.write can change it, and those are tracked directly.
+        Otherwise, the buffer is hashed and compared to the previous digest.
+
         :return:
         """
-        self._hasher.reset()
-        self._hasher.update(self._buffer)
-        digest = self._hasher.digest()
-        if digest != self._digest:
-            self._digest = digest
-            return True
-        else:
+        if self._exposed:
+            digest = xxhash.xxh3_64_intdigest(self._buffer.data)
+            if digest != self._digest:
+                self._digest = digest
+                return True
+            else:
+                return False
+
+        if self._version == self._seen_version:
             return False
 
+        self._seen_version = self._version
+        self._digest = None
+        return True
+
     @property
     def empty(self):
         """
-        Determine if the buffer is empty.
+        Determine if the buffer is empty, i.e. it contains nothing but blanks or null bytes.
+        The scan runs at C level over the raw cell data.
 
         :return:
         """
-        return not any(self._buffer)
+        return not self._buffer.data.tobytes().strip(b" \x00")
+
+    def write(self, row, column, value):
+        """
+        Write a value to the specified cell of the buffer.
+
+        :param row:
+        :param column:
+        :param value:
+        :return:
+        """
+        self._buffer[row, column] = value
+        self._version += 1
 
     def to_bytes(self):
         """
-        Merge the entire buffer to a byte string.
+        Merge the entire buffer to a byte string. The row-major cell data is exported
+        with a single tobytes call and joined at C level over row slices.
 
         :return:
         """
-        return b"\n".join(b"".join(self._buffer[i, :]) for i in range(self._buffer.shape[0]))
+        data = self._buffer.data.tobytes()
+        width = len(data) // self._buffer.shape[0]
+        return b"\n".join([data[i:i + width] for i in range(0, len(data), width)])
 
     def to_string(self, encoding="utf-8"):
         """
-        Merge the entire buffer to a string.
+        Merge the entire buffer to a string. The rows are joined at byte level and
+        decoded in a single call.
 
         :return:
         """
         return self.to_bytes().decode(encoding)
 
 
-@attr.s
+@attr.s(slots=True, cmp=False, hash=False)
 class InputOutputStream(Component):
     """
     Model input and output streams.
     """
-    test_output = bytearray(
+    test_output = bytes(
         "NUL: \0, BEL: \a, BSP: \b, TAB: \t, LF: \n, VT: \v, FF: \f, CR:, \r, SUB: \x1a, ESC: \x1b, DEL: \x7f",
         "utf-8"
     )
 
     input = attr.ib(default=attr.Factory(bytearray), validator=instance_of(bytearray))
-    output = attr.ib(default=test_output, validator=instance_of(bytearray))
+    output = attr.ib(default=attr.Factory(lambda: bytearray(InputOutputStream.test_output)),
+                     validator=instance_of(bytearray))
 
 
-@attr.s
+@attr.s(slots=True, cmp=False, hash=False)
 class ShellState(Component):
     """
     Model the environment of a shell.
@@ -537,9 +818,10 @@ class ShellState(Component):
         "PATH": ""
     }
 
-    env = attr.ib(default=default_env, validator=instance_of(dict))
+    env = attr.ib(default=attr.Factory(lambda: dict(ShellState.default_env)), validator=instance_of(dict))
     line_buffer = attr.ib(default=attr.Factory(bytearray), validator=instance_of(bytearray))
     path_sep = attr.ib(default=":", validator=instance_of(str))
+    _path_cache = attr.ib(default=None, init=False, repr=False)
 
     # stdin = attr.ib()
     # stdout = attr.ib()
@@ -554,4 +836,19 @@ class ShellState(Component):
 
     @property
     def path(self):
-        return list(filter(None, self.env.split(self.path_sep)))
+        """
+        Return the directories listed in the PATH environment variable. The split is
+        cached and only recalculated if the PATH string or the separator was replaced.
+        The result is a tuple, so that the cached value cannot be modified by callers.
+
+        :return:
+        """
+        path_value = self.env.get("PATH", "")
+        path_sep = self.path_sep
+        cache = self._path_cache
+        if cache is not None and cache[0] is path_value and cache[1] is path_sep:
+            return cache[2]
+
+        path_parts = tuple(p for p in path_value.split(path_sep) if p)
+        self._path_cache = (path_value, path_sep, path_parts)
+        return path_parts
@@ -8,7 +8,6 @@ import pathlib
 import shutil
 import weakref
 import collections
-import os
 
 import OpenGL.GL as gl
 import attr
@@ -23,9 +22,10 @@ from .exceptions import GLFWError
 from .utilities import subclass_of
 from .data_abstractions import KeyMap, ContextData, Scene
 from .model_parser import PlyParser
+from .wrappers import OpenGlState
 
 
-@attr.s
+@attr.s(slots=True)
 class World(object):
     """A simple application world.
 
@@ -59,6 +59,9 @@ class World(object):
     _event_queue = attr.ib(default=attr.Factory(collections.deque), validator=instance_of(collections.deque))
     _scene = attr.ib(default=None, validator=optional(instance_of(Scene)))
     _log = attr.ib(default=logging.getLogger(__name__), validator=instance_of(logging.Logger), repr=False)
+    _generation = attr.ib(default=0, init=False, repr=False)
+    _queries = attr.ib(default=attr.Factory(dict), init=False, repr=False)
+    _event_handlers = attr.ib(default=attr.Factory(dict), init=False, repr=False)
 
     @property
     def ctx(self):
@@ -87,64 +90,57 @@ class World(object):
 
     def _combined_components(self, comp_types):
         """
-        Combine the sets of components.
+        Combine the sets of components. Only the smallest component table is walked, the entities
+        found there are looked up in the others. No intermediate key sets are built. The result is
+        kept until a component is added or removed.
 
         :param comp_types:
         :return:
         """
-        comps = self._components
-        key_sets = [set(comps[ctype]) for ctype in comp_types]
-        value_sets = [comps[ctype] for ctype in comp_types]
-        entities = key_sets[0].intersection(*key_sets[1:])
+        cached = self._queries.get(comp_types)
+        if cached is not None and cached[0] == self._generation:
+            return cached[1]
 
-        for ent_key in entities:
-            yield tuple(component[ent_key] for component in value_sets)
+        comps = self._components
+        value_sets = [comps.get(ctype, {}) for ctype in comp_types]
+        smallest = min(value_sets, key=len)
+        combined = [
+            tuple(component[ent_key] for component in value_sets)
+            for ent_key in smallest if all(ent_key in component for component in value_sets)
+        ]
 
-    def _add_component(self, entity, component):
-        """
-        Add a supported component instance to the world.
-
-        :param entity:
-        :param component:
-        :return:
-        """
-        comp_type = type(component)
-        if comp_type not in self._components:
-            self._components[comp_type] = dict()
-        self._components[type(component)][entity] = component
+        self._queries[comp_types] = (self._generation, combined)
+        return combined
 
     def _add_components(self, entity):
         """
-        Register all components of an entity.
+        Register all components of an entity. The tables are updated directly, and the
+        cached queries are invalidated once for the whole entity.
 
         :param entity:
         :return:
         """
+        comps = self._components
         for c in entity.components:
-            self._add_component(entity, c)
-
-    def _remove_component(self, entity, component):
-        """
-        Remove the component instance from the world.
-
-        :param entity:
-        :param component:
-        :return:
-        """
-        comp_type = type(component)
-        self._components[comp_type].pop(entity)
-        if len(self._components[comp_type]) == 0:
-            self._components.pop(comp_type)
+            comps.setdefault(type(c), {})[entity] = c
+        self._generation += 1
 
     def _remove_components(self, entity):
         """
-        Remove the registered components of an entity.
+        Remove the registered components of an entity. The tables are updated directly, and the
+        cached queries are invalidated once for the whole entity.
 
         :param entity:
         :return:
         """
+        comps = self._components
         for c in entity.components:
-            self._remove_component(entity, c)
+            comp_type = type(c)
+            table = comps[comp_type]
+            del table[entity]
+            if not table:
+                del comps[comp_type]
+        self._generation += 1
 
     def get_components(self, comp_type):
         """
@@ -213,7 +209,8 @@ class World(object):
         :param entities:
         :return:
         """
-        for_removal = [e for e in self._entities if e not in entities]
+        requested = set(entities)
+        for_removal = [e for e in self._entities if e not in requested]
         for_addition = [e for e in entities if e not in self._entities]
         self.remove_entities(*for_removal)
         self.add_entities(*for_addition)
@@ -246,6 +243,8 @@ class World(object):
         """
         self._log.debug("Removing all Entities from this World.")
         self._entities.clear()
+        self._components.clear()
+        self._generation += 1
 
     def add_system(self, system):
         """
@@ -254,16 +253,20 @@ class World(object):
         :param system:
         :return:
         """
-        if system not in self.systems:
-            self._log.debug("Adding System '{}'.".format(system))
-            if isinstance(system, UpdateSystem):
-                self._update_systems.append(system)
-            elif isinstance(system, RenderSystem):
-                self._render_systems.append(system)
-            elif isinstance(system, EventSystem):
-                self._event_systems.append(system)
-            else:
-                raise TypeError("The specified system cannot be used as such.")
+        # Equal systems always share a class, so only the list of the matching kind needs to be searched.
+        if isinstance(system, UpdateSystem):
+            target = self._update_systems
+        elif isinstance(system, RenderSystem):
+            target = self._render_systems
+        elif isinstance(system, EventSystem):
+            target = self._event_systems
+        else:
+            raise TypeError("The specified system cannot be used as such.")
+
+        if system not in target:
+            self._log.debug("Adding System '%s'.", system)
+            target.append(system)
+            self._event_handlers.clear()
         else:
             raise ValueError("You cannot add multiple instances of a particular systme class.")
 
@@ -284,8 +287,9 @@ class World(object):
         :param systems:
         :return:
         """
-        for_removal = [s for s in self.systems if s not in systems]
-        for_addition = [s for s in systems if s not in self.systems]
+        current = self.systems
+        for_removal = [s for s in current if s not in systems]
+        for_addition = [s for s in systems if s not in current]
         self.remove_systems(*for_removal)
         self.add_systems(*for_addition)
 
@@ -302,6 +306,7 @@ class World(object):
             self._render_systems.remove(system)
         elif system in self._event_systems:
             self._event_systems.remove(system)
+            self._event_handlers.clear()
 
     def remove_systems(self, *systems):
         """
@@ -323,6 +328,7 @@ class World(object):
         self._update_systems.clear()
         self._render_systems.clear()
         self._event_systems.clear()
+        self._event_handlers.clear()
 
     def update(self, t, dt):
         """
@@ -363,25 +369,40 @@ class World(object):
         """
         self._event_queue.append(event)
 
+    def _get_event_handlers(self, event_type):
+        """
+        Return the event systems that accept events of the specified type. The selection is
+        kept per event type until the set of event systems changes.
+
+        :param event_type:
+        :return:
+        """
+        handlers = self._event_handlers.get(event_type)
+        if handlers is None:
+            handlers = tuple(s for s in self._event_systems if issubclass(event_type, s.event_types))
+            self._event_handlers[event_type] = handlers
+
+        return handlers
+
     def process(self):
         """
         Process all events.
 
         :return:
         """
-        while len(self._event_queue) > 0:
-            event = self._event_queue.popleft()
+        event_queue = self._event_queue
+        while event_queue:
+            event = event_queue.popleft()
             if isinstance(event, SceneEvent):
                 self._update_scene(event)
             else:
-                for system in self._event_systems:
-                    if isinstance(event, system.event_types):
-                        if system.is_applicator:
-                            comps = self._combined_components(system.component_types)
-                            system.process(event, self, comps)
-                        else:
-                            for comp_type in system.component_types:
-                                system.process(event, self, self._components[comp_type].values())
+                for system in self._get_event_handlers(type(event)):
+                    if system.is_applicator:
+                        comps = self._combined_components(system.component_types)
+                        system.process(event, self, comps)
+                    else:
+                        for comp_type in system.component_types:
+                            system.process(event, self, self._components[comp_type].values())
 
     def register_callbacks(self, window):
         """
@@ -409,7 +430,7 @@ class World(object):
 
     def callback_resize(self, window, width, height):
         for camera in self.get_entities(Camera):
-            camera.shape = (width, height)
+            camera.projection.shape = (width, height)
 
         gl.glViewport(0, 0, width, height)
 
@@ -505,14 +526,16 @@ class World(object):
         :param reference_tree:
         :return:
         """
+        ctx = self.ctx
         if isinstance(object_tree, dict):
             objects = dict()
             for k, v in object_tree.items():
                 cls = class_registry[v["class"]]
                 kwargs = self._parse_arguments(scene, v, reference_tree)
 
-                if hasattr(cls, "create"):
-                    objects[k] = cls.create(self.ctx, **kwargs)
+                create = getattr(cls, "create", None)
+                if create is not None:
+                    objects[k] = create(ctx, **kwargs)
                 else:
                     objects[k] = cls(**kwargs)
         else:
@@ -521,8 +544,9 @@ class World(object):
                 cls = class_registry[v["class"]]
                 kwargs = self._parse_arguments(scene, v, reference_tree)
 
-                if hasattr(cls, "create"):
-                    objects.append(cls.create(self.ctx, **kwargs))
+                create = getattr(cls, "create", None)
+                if create is not None:
+                    objects.append(create(ctx, **kwargs))
                 else:
                     objects.append(cls(**kwargs))
 
@@ -538,17 +562,20 @@ class World(object):
         :param reference_tree:
         :return:
         """
+        ctx = self.ctx
+        ctx_data = ctx.data
         kwargs = dict()
         for name, arg in obj["kwargs"].items():
             if isinstance(arg, str):
                 if arg in scene:
                     kwargs[name] = scene[arg]
-                elif arg in self.ctx.data:
-                    kwargs[name] = self.ctx.data[arg]
+                elif arg in ctx_data:
+                    kwargs[name] = ctx_data[arg]
                 elif reference_tree is not None and arg in reference_tree:
                     kwargs[name] = reference_tree[arg]
-                elif any(p in arg for p in (os.path.sep, "/", "\\")):
-                    kwargs[name] = self.ctx.resources / arg
+                elif "/" in arg or "\\" in arg:
+                    # os.path.sep is always one of the two
+                    kwargs[name] = ctx.resources / arg
                 else:
                     kwargs[name] = arg
             else:
@@ -625,22 +652,23 @@ class Context(object):
         config_user = states_path / ContextData.default_config_file
         keymap_user = states_path / ContextData.default_keymap_file
 
-        # Ensure that both directories (resources and states) are present
-        if not resources_path.exists():
-            raise FileNotFoundError(resources_path)
-        elif not resources_path.is_dir():
-            raise NotADirectoryError(resources_path)
+        # Ensure that both directories (resources and states) are present. In the common case,
+        # the resources directory exists and a single stat call suffices.
+        if not resources_path.is_dir():
+            if not resources_path.exists():
+                raise FileNotFoundError(resources_path)
+            else:
+                raise NotADirectoryError(resources_path)
 
         # Create the user config directory, unless it exists
-        if not states_path.exists():
-            states_path.mkdir(parents=True)
+        states_path.mkdir(parents=True, exist_ok=True)
 
         # Copy the default configuration to the user-specific directory
-        if not config_user.exists() or force:
+        if force or not config_user.exists():
             shutil.copyfile(str(config_default), str(config_user))
 
         # Copy the default key map to the user-specific directory
-        if not keymap_user.exists() or force:
+        if force or not keymap_user.exists():
             shutil.copyfile(str(keymap_default), str(keymap_user))
 
         return config_user, keymap_user
@@ -818,6 +846,7 @@ class Context(object):
 
             # Make the OpenGL context current
             glfw.make_context_current(self._window)
+            OpenGlState.reset()
 
             # Set the buffer swap interval (i.e. VSync)
             glfw.swap_interval(self.data.swap_interval)
@@ -825,7 +854,8 @@ class Context(object):
             # Determine the actual context version information
             context_major = gl.glGetIntegerv(gl.GL_MAJOR_VERSION)
             context_minor = gl.glGetIntegerv(gl.GL_MINOR_VERSION)
-            self._log.debug("Actually received an OpenGL Context {}.{}".format(context_major, context_minor))
+            self._log.debug("Actually received an OpenGL Context %s.%s", context_major, context_minor)
+            OpenGlState.set_version(context_major, context_minor)
 
             # Determine available OpenGL extensions
             # num_extensions = gl.glGetIntegerv(gl.GL_NUM_EXTENSIONS)
@@ -894,11 +924,11 @@ class Loop(object):
         user_home = pathlib.Path.home()
         engine_location = pathlib.Path(__file__).parent
 
-        self._log.debug("The user home is at '{}'.".format(user_home))
-        self._log.debug("The engine is located at '{}'.".format(engine_location))
+        self._log.debug("The user home is at '%s'.", user_home)
+        self._log.debug("The engine is located at '%s'.", engine_location)
 
         with self._ctx.create(self._name, user_home, engine_location, self._initialize, self._debug) as ctx:
-            self._log.debug("Entered context {}.".format(ctx))
+            self._log.debug("Entered context %s.", ctx)
             self._loop(ctx)
 
     def _loop(self, ctx):
@@ -915,31 +945,42 @@ class Loop(object):
         """
         self._log.info("Executing within the engine context.")
 
+        # The window, the world and the timing parameters stay fixed while the loop runs,
+        # so they are looked up only once.
+        window = ctx.window
+        world = ctx.world
+        delta_time = ctx.data.delta_time
+        max_frame_duration = ctx.data.max_frame_duration
+        get_time = glfw.get_time
+        poll_events = glfw.poll_events
+        window_should_close = glfw.window_should_close
+
         # Define the time for the event loop
         t = 0.0
-        current_time = glfw.get_time()
+        current_time = get_time()
         accumulator = 0.0
 
         # Create and run the event loop
-        while not glfw.window_should_close(ctx.window):
+        while not window_should_close(window):
             # Determine how much time we have to perform the physics
             # simulation.
-            new_time = glfw.get_time()
+            new_time = get_time()
             frame_time = new_time - current_time
             current_time = new_time
-            frame_time = min(frame_time, ctx.data.max_frame_duration)
+            if frame_time > max_frame_duration:
+                frame_time = max_frame_duration
             accumulator += frame_time
 
             # Run the game update until we have one DELTA_TIME left for the
             # rendering step.
-            while accumulator >= ctx.data.delta_time:
+            while accumulator >= delta_time:
                 # Poll and process events
-                glfw.poll_events()
-                ctx.world.process()
+                poll_events()
+                world.process()
 
-                ctx.world.update(t, ctx.data.delta_time)
-                t += ctx.data.delta_time
-                accumulator -= ctx.data.delta_time
+                world.update(t, delta_time)
+                t += delta_time
+                accumulator -= delta_time
 
             # Clear the screen and render the world.
-            ctx.world.render()
+            world.render()
@@ -7,6 +7,7 @@ Define data abstractions for various concepts.
 import array
 import ctypes
 import enum
+import functools
 import math
 import json
 
@@ -20,6 +21,18 @@ from .utilities import iterable_of, underscore_to_camelcase
 from .exceptions import SerializationError
 
 
+@functools.lru_cache(maxsize=None)
+def _field_names(cls):
+    """
+    Return the attribute names of an attrs class. The set of data model classes is small
+    and fixed, so the results are memoized.
+
+    :param cls:
+    :return:
+    """
+    return frozenset(a.name for a in attr.fields(cls))
+
+
 @attr.s
 class DataModel(object):
     """
@@ -56,21 +69,27 @@ class DataModel(object):
 
     def __iter__(self):
         """
-        Iterate over the scene properties.
+        Iterate over the scene properties. The names are taken from the attribute definitions,
+        so no dictionary of the whole instance is built.
 
         :return:
         """
-        for k in attr.asdict(self).keys():
-            yield k
+        for a in attr.fields(type(self)):
+            yield a.name
 
     def __getitem__(self, item):
         """
-        Allow angle-bracket access.
+        Allow angle-bracket access. Only the requested attribute is read, and nested
+        attrs values are returned as they are, not converted to dictionaries.
 
         :param item:
+        :raise KeyError:
         :return:
         """
-        return attr.asdict(self)[item]
+        if item in _field_names(type(self)):
+            return getattr(self, item)
+
+        raise KeyError(item)
 
 
 @attr.s
@@ -7,7 +7,7 @@ import attr
 from attr.validators import instance_of
 
 
-@attr.s
+@attr.s(slots=True, cmp=False, hash=False)
 class KeyEvent(object):
     window = attr.ib()
     key = attr.ib()
@@ -16,26 +16,26 @@ class KeyEvent(object):
     mods = attr.ib()
 
 
-@attr.s
+@attr.s(slots=True, cmp=False, hash=False)
 class CharEvent(object):
     window = attr.ib()
     codepoint = attr.ib()
 
 
-@attr.s
+@attr.s(slots=True, cmp=False, hash=False)
 class CursorEvent(object):
     window = attr.ib()
     xpos = attr.ib()
     ypos = attr.ib()
 
 
-@attr.s
+@attr.s(slots=True, cmp=False, hash=False)
 class CursorEnterEvent(object):
     window = attr.ib()
     entered = attr.ib()
 
 
-@attr.s
+@attr.s(slots=True, cmp=False, hash=False)
 class MouseButtonEvent(object):
     window = attr.ib()
     button = attr.ib()
@@ -43,13 +43,13 @@ class MouseButtonEvent(object):
     mods = attr.ib()
 
 
-@attr.s
+@attr.s(slots=True, cmp=False, hash=False)
 class ScrollEvent(object):
     window = attr.ib()
     xoffset = attr.ib()
     yoffset = attr.ib()
 
 
-@attr.s
+@attr.s(slots=True, cmp=False, hash=False)
 class SceneEvent(object):
     name = attr.ib(validator=instance_of(str))
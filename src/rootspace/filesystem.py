@@ -17,6 +17,11 @@ from .exceptions import RootspaceNotAnExecutableError, RootspaceFileNotFoundErro
 from .executables import Executable, registry
 from .utilities import to_ref, to_uuid
 
+# Human-readable representations of all 9-bit permission values, e.g. 0o754 -> "rwxr-xr--"
+PERM_STRINGS = tuple(
+    "".join(c if p & (0o400 >> i) else "-" for i, c in enumerate("rwxrwxrwx")) for p in range(0o1000)
+)
+
 
 @attr.s
 class Node(object):
@@ -63,12 +68,29 @@ class Node(object):
 
         :return:
         """
-        perm_digits = (self._perm // 64, (self._perm % 64) // 8, self._perm % 8)
-        perm_list = (((p // 4) > 0, ((p % 4) // 2) > 0, (p % 2) > 0) for p in perm_digits)
-        perm_groups = ("{}{}{}".format(
-            "r" if p[0] else "-", "w" if p[1] else "-", "x" if p[2] else "-"
-        ) for p in perm_list)
-        return "".join(perm_groups)
+        return PERM_STRINGS[self._perm & 0o777]
+
+    def _may(self, uid, gids, mode):
+        """
+        Return True if the supplied UID and GIDs are granted the access given by mode
+        (4 for read, 2 for write, 1 for execute) by the owner, group or other bits.
+
+        :param uid:
+        :param gids:
+        :param mode:
+        :return:
+        """
+        perm = self._perm
+        if perm & mode:
+            return True
+        if uid == self._uid and perm & (mode << 6):
+            return True
+        if perm & (mode << 3):
+            if not isinstance(gids, collections.Iterable):
+                gids = (gids,)
+            return any(gid == self._gid for gid in gids)
+
+        return False
 
     def may_read(self, uid, gids):
         """
@@ -79,20 +101,7 @@ class Node(object):
         :param gids:
         :return:
         """
-        if not isinstance(gids, collections.Iterable):
-            gids = (gids,)
-
-        perm_bits = (
-            ((self._perm // 64) // 4) > 0,
-            (((self._perm % 64) // 8) // 4) > 0,
-            ((self._perm % 8) // 4) > 0
-        )
-        privileged = (uid == 0)
-        user_perm = (uid == self._uid and perm_bits[0])
-        group_perm = (any(gid == self._gid for gid in gids) and perm_bits[1])
-        other_perm = perm_bits[2]
-
-        return privileged or user_perm or group_perm or other_perm
+        return uid == 0 or self._may(uid, gids, 0o4)
 
     def may_write(self, uid, gids):
         """
@@ -103,20 +112,7 @@ class Node(object):
         :param gids:
         :return:
         """
-        if not isinstance(gids, collections.Iterable):
-            gids = (gids,)
-
-        perm_bits = (
-            (((self._perm // 64) % 4) // 2) > 0,
-            ((((self._perm % 64) // 8) % 4) // 2) > 0,
-            (((self._perm % 8) % 4) // 2) > 0
-        )
-        privileged = (uid == 0)
-        user_perm = (uid == self._uid and perm_bits[0])
-        group_perm = (any(gid == self._gid for gid in gids) and perm_bits[1])
-        other_perm = perm_bits[2]
-
-        return privileged or user_perm or group_perm or other_perm
+        return uid == 0 or self._may(uid, gids, 0o2)
 
     def may_execute(self, uid, gids):
         """
@@ -127,20 +123,10 @@ class Node(object):
         :param gids:
         :return:
         """
-        if not isinstance(gids, collections.Iterable):
-            gids = (gids,)
+        if uid == 0:
+            return (self._perm & 0o111) > 0
 
-        perm_bits = (
-            ((self._perm // 64) % 2) > 0,
-            (((self._perm % 64) // 8) % 2) > 0,
-            ((self._perm % 8) % 2) > 0
-        )
-        privileged = (uid == 0 and any(perm_bits))
-        user_perm = (uid == self._uid and perm_bits[0])
-        group_perm = (any(gid == self._gid for gid in gids) and perm_bits[1])
-        other_perm = perm_bits[2]
-
-        return privileged or user_perm or group_perm or other_perm
+        return self._may(uid, gids, 0o1)
 
     def modify_parent(self, uid, gids, new_parent):
         """
@@ -265,6 +251,10 @@ class DirectoryNode(Node):
     """
     _contents = attr.ib(default=attr.Factory(dict), validator=instance_of(dict))
 
+    @property
+    def contents(self):
+        return self._contents
+
     def to_dict(self, uid, gids, recursive=True):
         serialised = super(DirectoryNode, self).to_dict(uid, gids)
 
@@ -429,7 +419,7 @@ class FileNode(Node):
 @attr.s
 class FileSystem(object):
     _db = attr.ib(validator=instance_of(str))
-    _hier = attr.ib(default=DirectoryNode(0, 0, 0o755), validator=instance_of(Node))
+    _hier = attr.ib(default=attr.Factory(lambda: DirectoryNode(0, 0, 0o755)), validator=instance_of(Node))
     root = attr.ib(default="/", validator=instance_of(str))
     sep = attr.ib(default="/", validator=instance_of(str))
     umask = attr.ib(default=0o022, validator=instance_of(int))
@@ -551,21 +541,21 @@ class FileSystem(object):
 
     def _find_node(self, uid, gids, path):
         """
-        Find the node specified by a given path.
+        Find the node specified by a given path. Return the node along with its parent,
+        which is None for the root node.
 
         :param uid:
         :param gids:
         :param path:
         :return:
         """
-        path_parts = self._split(path)
-        parent_node = self._hier
-        for i, node_name in enumerate(path_parts):
-            child_node = self._get_child_node(uid, gids, parent_node, node_name)
-            if i == len(path_parts) - 1:
-                return child_node, parent_node
-            else:
-                parent_node = child_node
+        parent_node = None
+        node = self._hier
+        for node_name in self._split(path):
+            parent_node = node
+            node = self._get_child_node(uid, gids, parent_node, node_name)
+
+        return node, parent_node
 
     def create_node(self, uid, gids, path, node_type):
         """
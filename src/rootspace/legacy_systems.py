@@ -221,7 +221,7 @@ class DisplayInterpreterSystem(UpdateSystem):
 
             # Parse the individual characters
             if b.to_bytes(1, sys.byteorder).decode(self._encoding).isprintable():
-                buffer.buffer[row, column] = b.to_bytes(1, sys.byteorder)
+                buffer.write(row, column, b.to_bytes(1, sys.byteorder))
                 column += 1
             elif b == 0x00:
                 warnings.warn("Null character not implemented.", FixmeWarning)
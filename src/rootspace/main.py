@@ -6,6 +6,8 @@
 import logging
 import argparse
 
+import attr
+
 from ._version import get_versions
 from .core import Loop, Context
 from .utilities import get_log_level, configure_logger
@@ -34,6 +36,10 @@ def main():
         log_level = get_log_level(args.verbose, args.debug)
         log = configure_logger(project_name, log_level, log_path=args.log_file, with_warnings=args.debug)
 
+        # Validators only guard against programming errors, so optimized runs (python -O) skip them
+        if not __debug__:
+            attr.set_run_validators(False)
+
         # Create the engine instance
         loop = Loop(project_name, Context, args.initialize, args.debug)
 
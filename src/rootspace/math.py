@@ -284,7 +284,7 @@ class Matrix(object):
 
     @property
     def t(self) -> "Matrix":
-        return Matrix(self._shape, self.data, transposed=(not self._transposed))
+        return Matrix._from_array(self._shape, self._data, not self._transposed)
 
     def is_close(self, other: Union["Matrix", int, float],
                  rel_tol: float = 1e-05, abs_tol: float = 1e-08) -> "Matrix":
@@ -415,7 +415,8 @@ class Matrix(object):
         self._transposed = transposed
 
         # Set the shape of the matrix
-        if isinstance(shape, tuple) and len(shape) == 2 and all(isinstance(s, int) and s > 0 for s in shape):
+        if isinstance(shape, tuple) and len(shape) == 2 and isinstance(shape[0], int) and isinstance(shape[1], int) \
+                and shape[0] > 0 and shape[1] > 0:
             self._shape = shape
         else:
             raise ValueError("The parameter 'shape' must be a 2-tuple of positive integers.")
@@ -427,20 +428,48 @@ class Matrix(object):
                 self._data = data
                 if len(self._data) != length:
                     raise ValueError("Expected an ArrayType of length '{}', got '{}'.".format(length, len(self._data)))
-            elif isinstance(data, collections.abc.Iterable):
+            elif isinstance(data, (tuple, list)) or isinstance(data, collections.abc.Iterable):
                 self._data = array.array(data_type, data)
                 if len(self._data) != length:
                     raise ValueError("Expected an iterable of length '{}', got '{}'.".format(length, len(self._data)))
             elif isinstance(data, (int, float)):
-                self._data = array.array(data_type, length * [data])
+                self._data = array.array(data_type, (data,)) * length
             else:
                 raise TypeError("Expected either an ArrayType, an iterable or a scalar number as positional argument.")
         else:
+            self._data = array.array(data_type, (0,)) * length
             if shape[0] == shape[1]:
-                self._data = array.array(data_type,
-                                         (1 if i in range(0, length, shape[0] + 1) else 0 for i in range(length)))
-            else:
-                self._data = array.array(data_type, (0 for _ in range(length)))
+                self._data[::shape[0] + 1] = array.array(data_type, (1,)) * shape[0]
+
+    @classmethod
+    def _from_array(cls, shape: Tuple[int, int], data: array.ArrayType, transposed: bool = False) -> "Matrix":
+        """
+        Create a Matrix from a shape and a freshly computed array of matching length. The arguments
+        are not validated, so this is reserved for results of the Matrix operations themselves.
+
+        :param shape:
+        :param data:
+        :param transposed:
+        :return:
+        """
+        matrix = cls.__new__(cls)
+        matrix._shape = shape
+        matrix._data = data
+        matrix._transposed = transposed
+        return matrix
+
+    def _elements(self) -> Sequence[Number]:
+        """
+        Return the elements in row-major order with respect to the logical shape. Unless the matrix
+        is transposed, this is the underlying array itself.
+
+        :return:
+        """
+        if not self._transposed:
+            return self._data
+        else:
+            columns = self._shape[1]
+            return [a for i in range(columns) for a in self._data[i::columns]]
 
     def __str__(self) -> str:
         """
@@ -520,6 +549,13 @@ class Matrix(object):
         :raise TypeError:
         :return:
         """
+        # Fast path for scalar element access
+        if type(key) is tuple and len(key) == 2 and type(key[0]) is int and type(key[1]) is int:
+            if self._transposed:
+                return self._data[key[1] * self._shape[1] + key[0]]
+            else:
+                return self._data[key[0] * self._shape[1] + key[1]]
+
         if isinstance(key, (int, slice)):
             # noinspection PyTypeChecker
             key = (key, slice(None))
@@ -664,10 +700,7 @@ class Matrix(object):
 
         :return:
         """
-        result = Matrix(self.shape, 0)
-        for i, j in itertools.product(range(result.shape[0]), range(result.shape[1])):
-            result[i, j] = -self[i, j]
-        return result
+        return Matrix._from_array(self.shape, array.array("f", [-a for a in self._elements()]))
 
     def __pos__(self) -> "Matrix":
         """
@@ -675,10 +708,7 @@ class Matrix(object):
 
         :return:
         """
-        result = Matrix(self.shape, 0)
-        for i, j in itertools.product(range(result.shape[0]), range(result.shape[1])):
-            result[i, j] = +self[i, j]
-        return result
+        return Matrix._from_array(self.shape, array.array("f", [+a for a in self._elements()]))
 
     def __abs__(self) -> "Matrix":
         """
@@ -686,10 +716,7 @@ class Matrix(object):
 
         :return:
         """
-        result = Matrix(self.shape, 0)
-        for i, j in itertools.product(range(result.shape[0]), range(result.shape[1])):
-            result[i, j] = abs(self[i, j])
-        return result
+        return Matrix._from_array(self.shape, array.array("f", [abs(a) for a in self._elements()]))
 
     def __add__(self, other: Numeric) -> "Matrix":
         """
@@ -701,17 +728,12 @@ class Matrix(object):
         """
         if isinstance(other, Matrix):
             if self.shape == other.shape:
-                result = Matrix(self.shape, 0)
-                for i, j in itertools.product(range(result.shape[0]), range(result.shape[1])):
-                    result[i, j] = self[i, j] + other[i, j]
-                return result
+                data = array.array("f", [a + b for a, b in zip(self._elements(), other._elements())])
+                return Matrix._from_array(self.shape, data)
             else:
                 raise ValueError("Shape mismatch: '{}' must be equal to '{}'".format(self.shape, other.shape))
         elif isinstance(other, (int, float)):
-            result = Matrix(self.shape, 0)
-            for i, j in itertools.product(range(result.shape[0]), range(result.shape[1])):
-                result[i, j] = self[i, j] + other
-            return result
+            return Matrix._from_array(self.shape, array.array("f", [a + other for a in self._elements()]))
         else:
             return NotImplemented
 
@@ -752,17 +774,12 @@ class Matrix(object):
         """
         if isinstance(other, Matrix):
             if self.shape == other.shape:
-                result = Matrix(self.shape, 0)
-                for i, j in itertools.product(range(result.shape[0]), range(result.shape[1])):
-                    result[i, j] = self[i, j] * other[i, j]
-                return result
+                data = array.array("f", [a * b for a, b in zip(self._elements(), other._elements())])
+                return Matrix._from_array(self.shape, data)
             else:
                 raise ValueError("Shape mismatch: '{}' must be equal to '{}'".format(self.shape, other.shape))
         elif isinstance(other, (int, float)):
-            result = Matrix(self.shape, 0)
-            for i, j in itertools.product(range(result.shape[0]), range(result.shape[1])):
-                result[i, j] = self[i, j] * other
-            return result
+            return Matrix._from_array(self.shape, array.array("f", [a * other for a in self._elements()]))
         else:
             return NotImplemented
 
@@ -785,17 +802,12 @@ class Matrix(object):
         """
         if isinstance(other, Matrix):
             if self.shape == other.shape:
-                result = Matrix(self.shape, 0)
-                for i, j in itertools.product(range(result.shape[0]), range(result.shape[1])):
-                    result[i, j] = self[i, j] / other[i, j]
-                return result
+                data = array.array("f", [a / b for a, b in zip(self._elements(), other._elements())])
+                return Matrix._from_array(self.shape, data)
             else:
                 raise ValueError("Shape mismatch: '{}' must be equal to '{}'".format(self.shape, other.shape))
         elif isinstance(other, (int, float)):
-            result = Matrix(self.shape, 0)
-            for i, j in itertools.product(range(result.shape[0]), range(result.shape[1])):
-                result[i, j] = self[i, j] / other
-            return result
+            return Matrix._from_array(self.shape, array.array("f", [a / other for a in self._elements()]))
         else:
             return NotImplemented
 
@@ -809,17 +821,12 @@ class Matrix(object):
         """
         if isinstance(other, Matrix):
             if self.shape == other.shape:
-                result = Matrix(self.shape, 0)
-                for i, j in itertools.product(range(result.shape[0]), range(result.shape[1])):
-                    result[i, j] = other[i, j] / self[i, j]
-                return result
+                data = array.array("f", [b / a for a, b in zip(self._elements(), other._elements())])
+                return Matrix._from_array(self.shape, data)
             else:
                 raise ValueError("Shape mismatch: '{}' must be equal to '{}'".format(self.shape, other.shape))
         elif isinstance(other, (int, float)):
-            result = Matrix(self.shape, 0)
-            for i, j in itertools.product(range(result.shape[0]), range(result.shape[1])):
-                result[i, j] = other / self[i, j]
-            return result
+            return Matrix._from_array(self.shape, array.array("f", [other / a for a in self._elements()]))
         else:
             return NotImplemented
 
@@ -837,11 +844,29 @@ class Matrix(object):
                 if result_shape == (1, 1):
                     return sum(a * b for a, b in zip(self, other))
                 else:
-                    result = Matrix(result_shape, 0)
-                    for i, j in itertools.product(range(result.shape[0]), range(result.shape[1])):
-                        result[i, j] = sum(a * b for a, b in zip(self[i, :], other[:, j]))
-
-                    return result
+                    # Operate directly on the flat buffers. The strides absorb the transposition flags,
+                    # so no intermediate row or column matrices need to be materialized.
+                    rows, inner = self.shape
+                    cols = other.shape[1]
+                    a = self._data
+                    b = other._data
+                    a_row, a_col = (self._shape[1], 1) if not self._transposed else (1, self._shape[1])
+                    b_row, b_col = (other._shape[1], 1) if not other._transposed else (1, other._shape[1])
+                    inner_range = range(inner)
+
+                    data = array.array("f", bytes(4 * rows * cols))
+                    idx = 0
+                    for i in range(rows):
+                        a_offset = i * a_row
+                        for j in range(cols):
+                            b_offset = j * b_col
+                            acc = 0
+                            for k in inner_range:
+                                acc += a[a_offset + k * a_col] * b[b_offset + k * b_row]
+                            data[idx] = acc
+                            idx += 1
+
+                    return Matrix._from_array(result_shape, data)
             else:
                 raise ValueError(
                     "Last dimension of '{}' and first dimension of '{}' do not match or are 1.".format(self.shape,
@@ -866,15 +891,14 @@ class Quaternion(object):
         :return:
         """
         if axis.is_3d_vector:
-            axis /= axis.norm()
-            angle %= 2 * math.pi
+            x, y, z = axis[0], axis[1], axis[2]
+            half_angle = (angle % (2 * math.pi)) / 2
 
-            c = math.cos(angle / 2)
-            s = math.sin(angle / 2)
+            # Normalizing the axis up front yields a unit quaternion without a second normalization.
+            c = math.cos(half_angle)
+            s = math.sin(half_angle) / math.sqrt(x * x + y * y + z * z)
 
-            q = cls(s * axis[0], s * axis[1], s * axis[2], c)
-
-            return q / q.norm()
+            return cls(s * x, s * y, s * z, c)
         else:
             raise ValueError("Expected a three-dimensional vector as axis, got '{}'.".format(axis))
 
@@ -882,6 +906,8 @@ class Quaternion(object):
     def from_vectors(cls, s: "Matrix", t: "Matrix") -> "Quaternion":
         """
         Create a Quaternion from two 3D vectors. The Quaternion describes the rotation from source to target.
+        The half-way formulation (s x t, |s||t| + s . t) works on unnormalized vectors and only needs a separate
+        branch for antiparallel vectors, where the rotation axis is undetermined.
 
         :param s:
         :param t:
@@ -889,20 +915,25 @@ class Quaternion(object):
         :return:
         """
         if s.is_3d_vector and t.is_3d_vector:
-            s /= s.norm()
-            t /= t.norm()
+            sx, sy, sz = s[0], s[1], s[2]
+            tx, ty, tz = t[0], t[1], t[2]
+
+            norms = math.sqrt((sx * sx + sy * sy + sz * sz) * (tx * tx + ty * ty + tz * tz))
+            r = norms + sx * tx + sy * ty + sz * tz
 
-            a = s.cross(t)
-            b = math.sqrt(2 * (1 + math.e))
+            if r > 1e-6 * norms:
+                qi, qj, qk = sy * tz - sz * ty, sz * tx - sx * tz, sx * ty - sy * tx
+            else:
+                # Rotate by half a turn about any axis orthogonal to the source vector.
+                r = 0.0
+                if abs(sx) > abs(sz):
+                    qi, qj, qk = -sy, sx, 0.0
+                else:
+                    qi, qj, qk = 0.0, -sz, sy
 
-            q = cls(
-                1 / b * a[0],
-                1 / b * a[1],
-                1 / b * a[2],
-                b / 2
-            )
+            n = math.sqrt(qi * qi + qj * qj + qk * qk + r * r)
 
-            return q / q.norm()
+            return cls(qi / n, qj / n, qk / n, r / n)
         else:
             raise ValueError("Expected three-dimensional vectors, got '{}' and '{}'.".format(s, t))
 
@@ -964,18 +995,7 @@ class Quaternion(object):
 
     @property
     def matrix(self) -> "Matrix":
-        i = self.qi
-        j = self.qj
-        k = self.qk
-        r = self.qr
-        s = 2 / self.norm()
-
-        return Matrix((4, 4), (
-            1 - s * (j ** 2 + k ** 2), s * (i * j - k * r), s * (i * k + j * r), 0,
-            s * (i * j + k * r), 1 - s * (i ** 2 + k ** 2), s * (j * k - i * r), 0,
-            s * (i * k - j * r), s * (j * k + i * r), 1 - s * (i ** 2 + j ** 2), 0,
-            0, 0, 0, 1
-        ))
+        return Matrix._from_array((4, 4), quaternion_to_matrix(self._data, array.array("f", bytes(64))))
 
     def all_close(self, other: "Quaternion", rel_tol: float = 1e-05, abs_tol: float = 1e-08) -> bool:
         """
@@ -1194,12 +1214,9 @@ class Quaternion(object):
         :return:
         """
         if isinstance(other, Quaternion):
-            return Quaternion(
-                self.qr * other.qi + self.qi * other.qr + self.qj * other.qk - self.qk * other.qj,
-                self.qr * other.qj - self.qi * other.qk + self.qj * other.qr + self.qk * other.qi,
-                self.qr * other.qk + self.qi * other.qj - self.qj * other.qi + self.qk * other.qr,
-                self.qr * other.qr - self.qi * other.qi - self.qj * other.qj - self.qk * other.qk
-            )
+            result = Quaternion(data_type=self._data.typecode)
+            quaternion_product(self._data, other._data, result._data)
+            return result
         elif isinstance(other, Matrix) and other.is_4d_vector:
             if other.is_row_vector:
                 other = other.t
@@ -1217,6 +1234,59 @@ class Quaternion(object):
             return NotImplemented
 
 
+def quaternion_product(a: Sequence[Number], b: Sequence[Number], out: Any) -> Any:
+    """
+    Calculate the Hamilton product of two packed quaternions (qi, qj, qk, qr) and store it in out.
+    The kernel operates on any indexable storage, e.g. array.array, and performs no allocations.
+
+    :param a:
+    :param b:
+    :param out:
+    :return:
+    """
+    ai, aj, ak, ar = a
+    bi, bj, bk, br = b
+
+    out[0] = ar * bi + ai * br + aj * bk - ak * bj
+    out[1] = ar * bj - ai * bk + aj * br + ak * bi
+    out[2] = ar * bk + ai * bj - aj * bi + ak * br
+    out[3] = ar * br - ai * bi - aj * bj - ak * bk
+
+    return out
+
+
+def quaternion_to_matrix(q: Sequence[Number], out: array.ArrayType) -> array.ArrayType:
+    """
+    Calculate the row-major 4x4 rotation matrix of a packed unit quaternion (qi, qj, qk, qr)
+    and store it in the 16 elements of out.
+
+    :param q:
+    :param out:
+    :return:
+    """
+    i, j, k, r = q
+    s = 2 / math.sqrt(i * i + j * j + k * k + r * r)
+
+    ii = i * i
+    jj = j * j
+    kk = k * k
+    ij = i * j
+    ik = i * k
+    jk = j * k
+    ir = i * r
+    jr = j * r
+    kr = k * r
+
+    out[:] = array.array(out.typecode, (
+        1 - s * (jj + kk), s * (ij - kr), s * (ik + jr), 0,
+        s * (ij + kr), 1 - s * (ii + kk), s * (jk - ir), 0,
+        s * (ik - jr), s * (jk + ir), 1 - s * (ii + jj), 0,
+        0, 0, 0, 1
+    ))
+
+    return out
+
+
 def all_close(a: Any, b: Any, rel_tol: float = 1e-05, abs_tol: float = 1e-08) -> bool:
     """
     Return true if objects a and b are approximately equal.
@@ -1309,9 +1379,20 @@ def equations_of_motion(delta_time: float, position: Matrix, momentum: Matrix, f
     :param mass:
     :return:
     """
-    dp, dm = velocity_verlet(delta_time, momentum, force, mass)
-    position_next = position + dp
-    momentum_next = momentum + dm
+    shape = position.shape
+    if position.is_vector and momentum.shape == shape and force.shape == shape:
+        # The velocity verlet integration is fused into a single pass over the vector elements,
+        # which avoids allocating the intermediate matrices.
+        half_step = delta_time / 2
+        step_per_mass = delta_time / mass
+        position_next = Matrix(shape, [
+            x + (p + f * half_step) * step_per_mass for x, p, f in zip(position.data, momentum.data, force.data)
+        ])
+        momentum_next = Matrix(shape, [p + f * step_per_mass for p, f in zip(momentum.data, force.data)])
+    else:
+        dp, dm = velocity_verlet(delta_time, momentum, force, mass)
+        position_next = position + dp
+        momentum_next = momentum + dm
 
     return position_next, momentum_next
 
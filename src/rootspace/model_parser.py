@@ -4,6 +4,7 @@
 """Implements parsers for resource files."""
 
 import array
+import functools
 import pathlib
 import mmap
 import struct
@@ -116,6 +117,17 @@ class PlyParser(object):
 
         :param base_shader_path:
         :param base_texture_path:
+        :return:
+        """
+        return cls(cls._header_grammar(), base_shader_path, base_texture_path)
+
+    @classmethod
+    @functools.lru_cache(maxsize=None)
+    def _header_grammar(cls):
+        """
+        Build the grammar of the PLY header. The grammar does not depend on the parser configuration,
+        so it is built only once and shared by all parser instances.
+
         :return:
         """
         # Define the base patterns for parsing
@@ -212,9 +224,7 @@ class PlyParser(object):
                        Group(ZeroOrMore(vertex_shader_comment | fragment_shader_comment | texture_comment | other_comment))("comments") + \
                        Group(OneOrMore(element_group))("elements")
 
-        header_grammar = start_keyword + declarations + stop_keyword
-
-        return cls(header_grammar, base_shader_path, base_texture_path)
+        return start_keyword + declarations + stop_keyword
 
     def tokenize_header(self, header_data):
         """
@@ -107,12 +107,14 @@ class CollisionSystem(UpdateSystem):
 
     def update(self, time, delta_time, world, components):
         for trf, bv, prp, state in components:
-            d_min = trf.t @ trf.r @ trf.s @ bv.minimum
-            d_max = trf.t @ trf.r @ trf.s @ bv.maximum
+            d_mat = trf.model_matrix
+            d_min = d_mat @ bv.minimum
+            d_max = d_mat @ bv.maximum
 
             for s in world.get_entities(StaticObject):
-                s_min = s.transform.t @ s.transform.r @ s.transform.s @ s.bounding_volume.minimum
-                s_max = s.transform.t @ s.transform.r @ s.transform.s @ s.bounding_volume.maximum
+                s_mat = s.transform.model_matrix
+                s_min = s_mat @ s.bounding_volume.minimum
+                s_max = s_mat @ s.bounding_volume.maximum
                 if aabb_overlap(d_min, d_max, s_min, s_max):
                     state.momentum = Matrix((3, 1), 0)
                     state.force = -prp.mass * prp.g
@@ -208,11 +210,12 @@ class CameraControlSystem(EventSystem):
         if not delta.all_close(0):
             self.cursor = cursor
             delta /= delta.norm() / multiplier
+            rot_along_up = Quaternion.from_axis(Matrix.ey(), -delta[0])
             for transform, projection in components:
+                # Compose both rotations as a Hamilton product, so only a single
+                # rotation matrix has to be built and applied.
                 rot_along_right = Quaternion.from_axis(transform.right, delta[1])
-                transform.r @= rot_along_right.matrix
-                rot_along_up = Quaternion.from_axis(Matrix.ey(), -delta[0])
-                transform.r @= rot_along_up.matrix
+                transform.r @= (rot_along_right @ rot_along_up).matrix
 
 
 @attr.s
@@ -226,15 +229,24 @@ class OpenGlRenderer(RenderSystem):
     def render(self, world, components):
         # Get a reference to the camera
         for camera in world.get_entities(Camera):
-            pv = camera.projection.matrix @ camera.transform.s @ camera.transform.r @ camera.transform.t
+            pv = camera.projection.matrix @ camera.transform.matrix
 
             # Clear the render buffers
             gl.glClear(world.scene.clear_bits)
 
-            # Render all models
+            # Group the instances by model, so that the rendering state is set up once per model
+            batches = dict()
             for transform, model in components:
+                if model in batches:
+                    batches[model].append(transform)
+                else:
+                    batches[model] = [transform]
+
+            # Render all models
+            for model, transforms in batches.items():
                 with model:
-                    model.draw(pv @ transform.t @ transform.r @ transform.s)
+                    for transform in transforms:
+                        model.draw(pv @ transform.matrix)
 
             # Swap the double buffer
             glfw.swap_buffers(world.ctx.window)
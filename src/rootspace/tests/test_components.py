@@ -0,0 +1,116 @@
+# -*- coding: utf-8 -*-
+
+import enum
+import math
+
+import pytest
+
+from rootspace.math import all_close, Matrix
+from rootspace.data_abstractions import Mesh
+from rootspace.components import Transform, DisplayBuffer, Model, _index_by_value
+
+
+class TestTransform(object):
+    @pytest.fixture(params=(False, True))
+    def transform(self, request):
+        c = math.cos(math.pi / 8)
+        s = math.sin(math.pi / 8)
+        return Transform.create(None, (1, -2, 3), (0, s, 0, c), (2, 3, 4), request.param)
+
+    def test_matrix(self, transform):
+        if transform.camera:
+            expected = transform.s @ transform.r @ transform.t
+        else:
+            expected = transform.t @ transform.r @ transform.s
+
+        assert all_close(transform.matrix, expected)
+
+    def test_model_matrix(self, transform):
+        assert all_close(transform.model_matrix, transform.t @ transform.r @ transform.s)
+
+    def test_assignment_drops_cached_matrix(self, transform):
+        before = transform.matrix
+        assert transform.matrix is before
+
+        transform.t = Matrix.translation(4, 5, 6)
+        assert transform.matrix is not before
+        assert transform.position.all_close(Matrix((3, 1), (-4, -5, -6) if transform.camera else (4, 5, 6)))
+
+        transform.s = Matrix.scaling(1, 1, 1)
+        transform.r = Matrix.identity(4)
+        if transform.camera:
+            assert all_close(transform.matrix, transform.s @ transform.r @ transform.t)
+        else:
+            assert all_close(transform.matrix, transform.t @ transform.r @ transform.s)
+
+    def test_assignment_drops_cached_basis(self, transform):
+        assert not transform.forward.all_close(Matrix((3, 1), (0, 0, -1)))
+
+        transform.r = Matrix.identity(4)
+        assert transform.right.all_close(Matrix((3, 1), (1, 0, 0)))
+        assert transform.up.all_close(Matrix((3, 1), (0, 1, 0)))
+        assert transform.forward.all_close(Matrix((3, 1), (0, 0, -1)))
+
+    def test_position_setter_drops_cached_matrix(self, transform):
+        before = transform.matrix
+        transform.position = Matrix((3, 1), (7, 8, 9))
+        assert transform.matrix is not before
+        assert transform.position.all_close(Matrix((3, 1), (7, 8, 9)))
+
+
+def test_index_by_value():
+    class Letter(enum.Enum):
+        A = 0
+        C = 2
+        D = 3
+
+    assert _index_by_value(Letter, {Letter.C: "c", Letter.A: "a"}) == ("a", None, "c", None)
+
+
+class TestModel(object):
+    def test_draw_modes(self):
+        assert len(Model.draw_modes) == max(m.value for m in Mesh.DrawMode) + 1
+        assert all(Model.draw_modes[m.value] is not None for m in Mesh.DrawMode)
+
+
+class TestDisplayBuffer(object):
+    @pytest.fixture
+    def display_buffer(self):
+        display_buffer = DisplayBuffer.create((3, 4))
+        assert display_buffer.modified
+        return display_buffer
+
+    def test_no_change(self, display_buffer):
+        assert not display_buffer.modified
+
+    def test_write(self, display_buffer):
+        display_buffer.write(1, 2, 0x41)
+        assert display_buffer.modified
+        assert not display_buffer.modified
+
+    def test_buffer_access_without_change(self, display_buffer):
+        display_buffer.buffer
+        assert not display_buffer.modified
+
+    def test_buffer_write(self, display_buffer):
+        buffer = display_buffer.buffer
+        buffer[0, 0] = 0x41
+        assert display_buffer.modified
+        assert not display_buffer.modified
+
+        # The buffer stays exposed, so later writes through the same reference are seen as well
+        buffer[0, 1] = 0x42
+        assert display_buffer.modified
+        assert not display_buffer.modified
+
+    def test_write_after_buffer_access(self, display_buffer):
+        display_buffer.buffer
+        display_buffer.write(2, 3, 0x41)
+        assert display_buffer.modified
+        assert not display_buffer.modified
+
+    def test_write_before_buffer_access(self, display_buffer):
+        display_buffer.write(2, 3, 0x41)
+        display_buffer.buffer
+        assert display_buffer.modified
+        assert not display_buffer.modified
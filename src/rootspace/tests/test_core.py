@@ -0,0 +1,86 @@
+# -*- coding: utf-8 -*-
+
+import weakref
+
+import attr
+import pytest
+
+from rootspace.core import World
+from rootspace.entities import Entity
+from rootspace.components import Transform, PhysicsState, Model
+
+
+@attr.s(hash=False)
+class Mover(Entity):
+    register = False
+
+    transform = attr.ib()
+    physics_state = attr.ib()
+
+
+@attr.s(hash=False)
+class Marker(Entity):
+    register = False
+
+    transform = attr.ib()
+
+
+class TestWorld(object):
+    @pytest.fixture
+    def world(self):
+        return World(weakref.ref(self))
+
+    @pytest.fixture
+    def mover(self):
+        return Mover(Transform.create(None), PhysicsState.create(None))
+
+    @pytest.fixture
+    def marker(self):
+        return Marker(Transform.create(None))
+
+    def test_query(self, world, mover, marker):
+        world.add_entities(mover, marker)
+
+        assert world._combined_components((Transform, PhysicsState)) == [(mover.transform, mover.physics_state)]
+        transforms = [t for t, in world._combined_components((Transform,))]
+        assert len(transforms) == 2
+        assert mover.transform in transforms
+        assert marker.transform in transforms
+
+    def test_query_cached(self, world, mover):
+        world.add_entity(mover)
+
+        first = world._combined_components((Transform, PhysicsState))
+        assert world._combined_components((Transform, PhysicsState)) is first
+
+    def test_query_after_add_entity(self, world, mover, marker):
+        world.add_entity(marker)
+        before = world._combined_components((Transform,))
+
+        world.add_entity(mover)
+        after = world._combined_components((Transform,))
+        assert after is not before
+        assert len(after) == 2
+
+    def test_query_after_remove_entity(self, world, mover, marker):
+        world.add_entities(mover, marker)
+        before = world._combined_components((Transform, PhysicsState))
+
+        world.remove_entity(mover)
+        after = world._combined_components((Transform, PhysicsState))
+        assert after is not before
+        assert after == []
+        assert world._combined_components((Transform,)) == [(marker.transform,)]
+
+    def test_query_after_remove_all_entities(self, world, mover, marker):
+        world.add_entities(mover, marker)
+        world._combined_components((Transform,))
+
+        world.remove_all_entities()
+        assert world._combined_components((Transform,)) == []
+
+    def test_query_missing_component_type(self, world, mover):
+        world.add_entity(mover)
+
+        assert world._combined_components((Model,)) == []
+        assert world._combined_components((Transform, Model)) == []
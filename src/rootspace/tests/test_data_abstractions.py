@@ -3,8 +3,36 @@
 import array
 import ctypes
 
+import attr
+import pytest
 
-from rootspace.data_abstractions import Attribute, Mesh
+from rootspace.data_abstractions import DataModel, ContextData, Attribute, Mesh
+
+
+class TestContextData(object):
+    def test_iter(self):
+        assert tuple(ContextData()) == tuple(a.name for a in attr.fields(ContextData))
+
+    def test_getitem(self):
+        data = ContextData(window_title="Test")
+        assert data["window_title"] == "Test"
+        assert data["delta_time"] == data.delta_time
+
+        with pytest.raises(KeyError):
+            data["does_not_exist"]
+
+    def test_getitem_nested(self):
+        @attr.s
+        class Inner(object):
+            value = attr.ib(default=1)
+
+        @attr.s
+        class Outer(DataModel):
+            inner = attr.ib(default=attr.Factory(Inner))
+
+        data = Outer()
+        assert data["inner"] is data.inner
+        assert isinstance(data["inner"], Inner)
 
 
 class TestAttribute(object):
@@ -31,6 +31,8 @@ class TestNode(object):
 
     def test_perm_str(self):
         assert isinstance(Node(0, 0, 0)._perm_str(), str)
+        assert Node(0, 0, 0o754)._perm_str() == "rwxr-xr--"
+        assert Node(0, 0, 0o000)._perm_str() == "---------"
 
     def test_may_read(self):
         uids = (0, 1, 1000)
@@ -387,9 +389,16 @@ class TestFileSystem(object):
     def test_find_node_calls(self, mocker):
         raise NotImplementedError()
 
-    @pytest.mark.xfail(raises=NotImplementedError)
     def test_find_node_value(self):
-        raise NotImplementedError()
+        usr = DirectoryNode(0, 0, 0o755)
+        hier = DirectoryNode(0, 0, 0o755, contents={"usr": usr})
+        hier.update_children(0, (0,))
+        fs = FileSystem("", hier)
+
+        assert fs._find_node(0, (0,), "/") == (hier, None)
+        assert fs._find_node(0, (0,), "/usr") == (usr, hier)
+        with pytest.raises(RootspaceFileNotFoundError):
+            fs._find_node(0, (0,), "/usr/bin")
 
     @pytest.mark.xfail(raises=NotImplementedError)
     def test_create_node_calls_dir(self):
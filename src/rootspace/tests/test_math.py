@@ -1,6 +1,7 @@
 # -*- coding: utf-8 -*-
 
 import math
+import array
 import itertools
 import functools
 import operator
@@ -8,7 +9,8 @@ import collections.abc
 
 import pytest
 
-from rootspace.math import all_close, Matrix, Quaternion
+from rootspace.math import all_close, Matrix, Quaternion, quaternion_product, quaternion_to_matrix, \
+    velocity_verlet, equations_of_motion
 
 
 class TestMatrix(object):
@@ -37,6 +39,11 @@ class TestMatrix(object):
         a = Matrix(shape)
         assert Matrix(shape, a._data)._data is a._data
 
+    def test_instantiation_shape(self):
+        for shape in ((0, 1), (1, 0), (-1, 4), (4,), (4, 4, 4), [4, 4], (4.0, 4), "44"):
+            with pytest.raises(ValueError):
+                Matrix(shape)
+
     def test_traits(self):
         assert issubclass(Matrix, collections.abc.Reversible)
         assert issubclass(Matrix, collections.abc.Collection)
@@ -136,6 +143,12 @@ class TestMatrix(object):
         assert m[(0, 1), ] == Matrix((2, 4), (0, 1, 2, 3, 4, 5, 6, 7))
         assert m[:] == m
 
+    def test_getitem_scalar(self):
+        m = Matrix((3, 4), range(12))
+        for i, j in itertools.product(range(3), range(4)):
+            assert m[i, j] == 4 * i + j
+            assert m.t[j, i] == 4 * i + j
+
     def test_setitem(self):
         m = Matrix((4, 4), range(16))
         m[0, 1] = 100
@@ -479,6 +492,20 @@ class TestQuaternion(object):
     def test_from_axis(self):
         raise NotImplementedError()
 
+    def test_from_vectors(self):
+        a = Quaternion.from_vectors(Matrix.ex(), 2 * Matrix.ey())
+        assert all_close(a, Quaternion.from_axis(Matrix.ez(), math.pi / 2))
+        assert all_close(a.matrix @ Matrix((4, 1), (1, 0, 0, 1)), Matrix((4, 1), (0, 1, 0, 1)), abs_tol=1e-6)
+
+        b = Quaternion.from_vectors(Matrix.ey(), -Matrix.ey())
+        assert math.isclose(b.norm(), 1)
+        assert all_close(b.matrix @ Matrix((4, 1), (0, 1, 0, 1)), Matrix((4, 1), (0, -1, 0, 1)), abs_tol=1e-6)
+
+        assert Quaternion.from_vectors(Matrix.ez(), Matrix.ez()) == Quaternion()
+
+        with pytest.raises(ValueError):
+            Quaternion.from_vectors(Matrix((4, 1), 1), Matrix.ex())
+
     def test_slerp(self):
         a = Quaternion(1, 0, 0, 1)
         b = Quaternion(0, 1, 0, 1)
@@ -607,6 +634,27 @@ class TestQuaternion(object):
         assert a @ b @ a.inverse() == Quaternion(1, 2, 3, 4)
 
 
+def test_quaternion_product():
+    a = array.array("f", (1, 2, 3, 4))
+    b = array.array("f", (5, 6, 7, 8))
+    out = array.array("f", bytes(16))
+
+    assert quaternion_product(a, b, out) is out
+    assert Quaternion(*out) == Quaternion(1, 2, 3, 4) @ Quaternion(5, 6, 7, 8)
+    assert quaternion_product(a, (0, 0, 0, 1), out) == a
+
+
+def test_quaternion_to_matrix():
+    out = array.array("f", bytes(64))
+
+    assert quaternion_to_matrix((0, 0, 0, 1), out) is out
+    assert Matrix((4, 4), out) == Matrix.identity(4)
+
+    q = Quaternion.from_axis(Matrix.ez(), math.pi / 2)
+    quaternion_to_matrix(q.data, out)
+    assert all_close(Matrix((4, 4), out) @ Matrix((4, 1), (1, 0, 0, 1)), Matrix((4, 1), (0, 1, 0, 1)), abs_tol=1e-6)
+
+
 @pytest.mark.xfail
 def test_all_close():
     raise NotImplementedError()
@@ -627,6 +675,16 @@ def test_velocity_verlet():
     raise NotImplementedError()
 
 
-@pytest.mark.xfail
 def test_equations_of_motion():
-    raise NotImplementedError()
+    position = Matrix((3, 1), (1, 2, 3))
+    momentum = Matrix((3, 1), (0.5, -1, 0))
+    force = Matrix((3, 1), (0, -9.81, 2))
+    dp, dm = velocity_verlet(0.1, momentum, force, 2.0)
+
+    position_next, momentum_next = equations_of_motion(0.1, position, momentum, force, 2.0)
+    assert all_close(position_next, position + dp)
+    assert all_close(momentum_next, momentum + dm)
+
+    position_next, momentum_next = equations_of_motion(0.1, position.t, momentum.t, force.t, 2.0)
+    assert all_close(position_next, (position + dp).t)
+    assert all_close(momentum_next, (momentum + dm).t)
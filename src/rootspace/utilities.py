@@ -2,6 +2,7 @@
 # -*- coding: utf-8 -*-
 
 import collections
+import functools
 import logging
 import re
 import uuid
@@ -130,9 +131,11 @@ def linearize_indices(shape: Tuple[int, ...], i: int, j: int) -> Tuple[int, ...]
         raise TypeError("Expected the tuple indices to be either int or slice, not '{}' and '{}'.".format(type(i), type(j)))
 
 
+@functools.lru_cache(maxsize=None)
 def underscore_to_camelcase(name: str) -> str:
     """
-    Convert underscored_text to CamelCase text.
+    Convert underscored_text to CamelCase text. The set of names is small and fixed,
+    so the results are memoized.
 
     :param str name:
     :return:
@@ -140,9 +143,11 @@ def underscore_to_camelcase(name: str) -> str:
     return "".join(x.capitalize() or "_" for x in name.split("_"))
 
 
+@functools.lru_cache(maxsize=None)
 def camelcase_to_underscore(name: str) -> str:
     """
-    Convert CamelCase text to underscored_text.
+    Convert CamelCase text to underscored_text. The set of names is small and fixed,
+    so the results are memoized.
 
     :param str name:
     :return:
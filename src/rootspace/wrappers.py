@@ -37,6 +37,58 @@ class Shader(object):
         return cls(vertex_source, fragment_source)
 
 
+class OpenGlState(object):
+    """
+    OpenGlState shadows the binding points of the current OpenGL context, so that redundant
+    state changes never reach the driver. All bindings must go through this class to keep the
+    shadow state accurate.
+    """
+    vertex_array = 0
+    program = 0
+    texture_2d = 0
+    buffer_storage = False
+
+    @classmethod
+    def set_version(cls, major, minor):
+        """
+        Record the capabilities of the current context that depend on its version.
+
+        :param major:
+        :param minor:
+        :return:
+        """
+        cls.buffer_storage = (major, minor) >= (4, 4) and bool(gl.glBufferStorage)
+
+    @classmethod
+    def bind_vertex_array(cls, obj):
+        if cls.vertex_array != obj:
+            gl.glBindVertexArray(obj)
+            cls.vertex_array = obj
+
+    @classmethod
+    def use_program(cls, obj):
+        if cls.program != obj:
+            gl.glUseProgram(obj)
+            cls.program = obj
+
+    @classmethod
+    def bind_texture_2d(cls, obj):
+        if cls.texture_2d != obj:
+            gl.glBindTexture(gl.GL_TEXTURE_2D, obj)
+            cls.texture_2d = obj
+
+    @classmethod
+    def reset(cls):
+        """
+        Forget the shadowed state, e.g. after a new OpenGL context has been made current.
+
+        :return:
+        """
+        cls.vertex_array = 0
+        cls.program = 0
+        cls.texture_2d = 0
+
+
 @attr.s
 class Texture(object):
     """
@@ -64,6 +116,8 @@ class Texture(object):
     @classmethod
     def _delete_textures(cls, obj):
         if bool(gl.glDeleteTextures) and obj > 0:
+            if OpenGlState.texture_2d == obj:
+                OpenGlState.bind_texture_2d(0)
             warnings.warn("glDeleteTextures throws an 'invalid operation (1282)' sometimes.", FixmeWarning)
             gl.glDeleteTextures(obj)
 
@@ -89,7 +143,7 @@ class Texture(object):
             ctx_mgr.callback(cls._delete_textures, obj)
 
             # Set texture parameters
-            gl.glBindTexture(gl.GL_TEXTURE_2D, obj)
+            OpenGlState.bind_texture_2d(obj)
             gl.glTexParameteri(gl.GL_TEXTURE_2D, gl.GL_TEXTURE_MIN_FILTER, min_filter)
             gl.glTexParameteri(gl.GL_TEXTURE_2D, gl.GL_TEXTURE_MAG_FILTER, mag_filter)
             gl.glTexParameteri(gl.GL_TEXTURE_2D, gl.GL_TEXTURE_WRAP_S, wrap_mode)
@@ -100,7 +154,7 @@ class Texture(object):
                 gl.GL_TEXTURE_2D, 0, image_format, shape[0], shape[1], 0, image_format, image_dtype,
                 data.transpose(PIL.Image.FLIP_LEFT_RIGHT).transpose(PIL.Image.FLIP_TOP_BOTTOM).tobytes()
             )
-            gl.glBindTexture(gl.GL_TEXTURE_2D, 0)
+            OpenGlState.bind_texture_2d(0)
 
             ctx_exit = ctx_mgr.pop_all()
 
@@ -127,27 +181,19 @@ class Texture(object):
 
         :return:
         """
-        if not self.enabled:
-            gl.glBindTexture(gl.GL_TEXTURE_2D, self._obj)
-        else:
-            self._log.warning("Attempting to enable an active texture.")
-
+        OpenGlState.bind_texture_2d(self._obj)
         return self
 
     def __exit__(self, exc_type, exc_val, exc_tb):
         """
-        Disable the texture.
+        Leave the texture bound. The next texture to be enabled replaces the binding, which avoids
+        an unbinding round-trip per draw call.
 
         :param exc_type:
         :param exc_val:
         :param exc_tb:
         :return:
         """
-        if self.enabled:
-            gl.glBindTexture(gl.GL_TEXTURE_2D, 0)
-        else:
-            self._log.warning("Attempting to disable an inactive texture.")
-
         return False
 
 
@@ -203,10 +249,14 @@ class OpenGlProgram(object):
     _obj = attr.ib(validator=instance_of(int))
     _log = attr.ib(validator=instance_of(logging.Logger), repr=False)
     _ctx_exit = attr.ib(validator=instance_of(contextlib.ExitStack), repr=False)
+    _locations = attr.ib(default=attr.Factory(dict), init=False, repr=False)
+    _values = attr.ib(default=attr.Factory(dict), init=False, repr=False)
 
     @classmethod
     def _delete_program(cls, obj):
         if bool(gl.glDeleteProgram) and obj > 0:
+            if OpenGlState.program == obj:
+                OpenGlState.use_program(0)
             gl.glDeleteProgram(obj)
 
     @classmethod
@@ -252,11 +302,14 @@ class OpenGlProgram(object):
         return gl.glGetIntegerv(gl.GL_CURRENT_PROGRAM) == self._obj
 
     def uniform_location(self, name):
-        loc = gl.glGetUniformLocation(self._obj, name)
-        if loc == -1:
-            raise OpenGLError("Could not find the shader uniform '{}'.".format(name))
-        else:
-            return loc
+        loc = self._locations.get(name)
+        if loc is None:
+            loc = gl.glGetUniformLocation(self._obj, name)
+            if loc == -1:
+                raise OpenGLError("Could not find the shader uniform '{}'.".format(name))
+            self._locations[name] = loc
+
+        return loc
 
     def attribute_location(self, name):
         loc = gl.glGetAttribLocation(self._obj, name)
@@ -266,16 +319,30 @@ class OpenGlProgram(object):
             return loc
 
     def uniform(self, name, value):
-        loc = self.uniform_location(name)
+        """
+        Set a uniform variable of the program. Uniform values are part of the program state,
+        so a value that equals the last one set is not uploaded again.
+
+        :param name:
+        :param value:
+        :return:
+        """
         if isinstance(value, Matrix):
             if value.shape == (4, 4):
-                gl.glUniformMatrix4fv(loc, 1, True, bytes(value))
+                data = bytes(value)
+                if self._values.get(name) != data:
+                    gl.glUniformMatrix4fv(self.uniform_location(name), 1, True, data)
+                    self._values[name] = data
             else:
                 raise NotImplementedError("Cannot set any other matrix shapes yet.")
-        elif isinstance(value, int):
-            gl.glUniform1i(loc, value)
-        elif isinstance(value, float):
-            gl.glUniform1f(loc, value)
+        elif isinstance(value, (int, float)):
+            key = (type(value), value)
+            if self._values.get(name) != key:
+                if isinstance(value, int):
+                    gl.glUniform1i(self.uniform_location(name), value)
+                else:
+                    gl.glUniform1f(self.uniform_location(name), value)
+                self._values[name] = key
         else:
             raise NotImplementedError("Cannot set any other data types yet.")
 
@@ -285,25 +352,17 @@ class OpenGlProgram(object):
 
         :return:
         """
-        if not self.enabled:
-            gl.glUseProgram(self._obj)
-        else:
-            self._log.warning("Attempting to enable an active shader program.")
-
+        OpenGlState.use_program(self._obj)
         return self
 
     def __exit__(self, exc_type, exc_val, exc_tb):
         """
-        Disable the program.
+        Leave the program bound. The next program to be enabled replaces the binding, which avoids
+        an unbinding round-trip per draw call.
 
         :param exc_type:
         :param exc_val:
         :param exc_tb:
         :return:
         """
-        if self.enabled:
-            gl.glUseProgram(0)
-        else:
-            self._log.warning("Attempting to disable an inactive shader program.")
-
         return False